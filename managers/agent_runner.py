@@ -2,11 +2,9 @@ import os
 import random
 import asyncio
 import time
-import openai
-import threading
-from concurrent.futures import ThreadPoolExecutor
 from utils.logger import Logger
-from managers.agents_manager import AgentsManager
+from utils.openai_client import get_openai_client
+from managers.agents_manager import AgentsManager, AGENT_TYPES
 from managers.objective_manager import ObjectiveManager
 from managers.aider_manager import AiderManager
 
@@ -16,6 +14,23 @@ DEFAULT_AGENT_COUNT = 10
 AGENT_START_DELAY = 10  # seconds between agent starts
 DEFAULT_MISSION_FILE = ".aider.mission.md"
 
+# Emoji shown for each agent type
+AGENT_EMOJIS = {
+    'specification': '📌',
+    'management': '🧭',
+    'writing': '✍️',
+    'evaluation': '⚖️',
+    'deduplication': '👥',
+    'chronicler': '📜',
+    'redundancy': '🎭',
+    'production': '🏭',
+    'researcher': '🔬',
+    'integration': '🌐'
+}
+
+# Agent types paired with their definition file names, built once at import
+AGENT_FILES = tuple((agent_type, f".aider.agent.{agent_type}.md") for agent_type in AGENT_TYPES)
+
 class AgentRunner:
     """Runner class for executing and managing agent operations.
     
@@ -25,7 +40,7 @@ class AgentRunner:
     
     Attributes:
         logger (Logger): Logging utility instance
-        agents_manager (AgentsManager): Manager for agent generation and configuration
+        agents_manager (AgentsManager): Manager for agent generation, created on first use
         objective_manager (ObjectiveManager): Manager for agent objectives
         aider_manager (AiderManager): Manager for aider operations
         _active_agents (set): Set of currently active agent names
@@ -35,13 +50,20 @@ class AgentRunner:
     def __init__(self, model="gpt-4o-mini"):
         """Initialize the runner with required managers and synchronization primitives."""
         self.logger = Logger(model=model)
-        self.agents_manager = AgentsManager(model=model)
+        self._agents_manager = None  # Only needed when agents must be generated
         self.objective_manager = ObjectiveManager(model=model)
         self.aider_manager = AiderManager(model=model)
         self._active_agents = set()  # Track active agents
         self._agent_lock = asyncio.Lock()  # Use asyncio.Lock for async operations
         self.model = model
 
+    @property
+    def agents_manager(self):
+        """Manager for agent generation, created on first access."""
+        if self._agents_manager is None:
+            self._agents_manager = AgentsManager(model=self.model)
+        return self._agents_manager
+
     def _validate_mission_file(self, mission_filepath):
         """
         Validate that mission file exists and is readable.
@@ -87,15 +109,7 @@ class AgentRunner:
         """Run agents in parallel."""
         try:
             # First validate mission file
-            if not os.path.exists(mission_filepath):
-                self.logger.error("❌ Mission file not found!")
-                self.logger.info("\n📋 To start KinOS, you must:")
-                self.logger.info("   1. Either create a '.aider.mission.md' file in the current folder")
-                self.logger.info("   2. Or specify the path to your mission file with --mission")
-                self.logger.info("\n💡 Examples:")
-                self.logger.info("   kin run agents --generate")
-                self.logger.info("   kin run agents --generate --mission path/to/my_mission.md")
-                self.logger.info("\n📝 The mission file must contain your project description.")
+            if not self._validate_mission_file(mission_filepath):
                 raise SystemExit(1)
 
             # Then check for missing agents
@@ -158,19 +172,7 @@ class AgentRunner:
             
     def _get_agent_emoji(self, agent_type):
         """Get the appropriate emoji for an agent type."""
-        agent_emojis = {
-            'specification': '📌',
-            'management': '🧭',
-            'writing': '✍️',
-            'evaluation': '⚖️',
-            'deduplication': '👥',
-            'chronicler': '📜',
-            'redundancy': '🎭',
-            'production': '🏭',
-            'researcher': '🔬',
-            'integration': '🌐' 
-        }
-        return agent_emojis.get(agent_type, '🤖')
+        return AGENT_EMOJIS.get(agent_type, '🤖')
 
     def _agents_exist(self, force_regenerate=False):
         """
@@ -182,28 +184,12 @@ class AgentRunner:
         Returns:
             list: List of agent types to generate/regenerate
         """
-        agent_types = [
-            "specification",
-            "management", 
-            "writing",
-            "evaluation",
-            "deduplication",
-            "chronicler",
-            "redundancy",
-            "production",
-            "researcher",
-            "integration"
-        ]
-        
         if force_regenerate:
-            return agent_types
+            return list(AGENT_TYPES)
             
-        missing_agents = []
-        for agent_type in agent_types:
-            if not os.path.exists(f".aider.agent.{agent_type}.md"):
-                missing_agents.append(agent_type)
-                
-        return missing_agents
+        existing_files = self._list_agent_files()
+        return [agent_type for agent_type, filename in AGENT_FILES
+                if filename not in existing_files]
         
     async def _run_single_agent_cycle(self, mission_filepath, model="gpt-4o-mini"):
         """Execute a single cycle for one agent."""
@@ -215,8 +201,8 @@ class AgentRunner:
                 await asyncio.sleep(1)  # Wait if no agent available
                 return
             
-            start_time = time.time()
-            self.logger.info(f"🕐 Agent {agent_name} starting cycle at {start_time}")
+            start_time = time.monotonic()
+            self.logger.info(f"🕐 Agent {agent_name} starting cycle at {time.time()}")
             
             # Execute agent cycle - now properly awaited
             await self._execute_agent_cycle(
@@ -225,7 +211,7 @@ class AgentRunner:
                 model
             )
             
-            end_time = time.time()
+            end_time = time.monotonic()
             duration = end_time - start_time
             self.logger.info(f"⏱️ Agent {agent_name} completed cycle in {duration:.2f} seconds")
             
@@ -319,7 +305,7 @@ class AgentRunner:
             prompt = self._create_folder_context_prompt(rel_path, files, subfolders, mission_content)
             self.logger.debug(f"\n🔍 FOLDER CONTEXT PROMPT for {rel_path}:\n{prompt}")
             
-            client = openai.OpenAI()
+            client = get_openai_client()
             response = client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
@@ -413,21 +399,15 @@ class AgentRunner:
 
     def _get_available_agents(self):
         """List available agents."""
-        agent_types = [
-            "specification",
-            "management", 
-            "writing",
-            "evaluation",
-            "deduplication",
-            "chronicler",
-            "redundancy",
-            "production",
-            "researcher",
-            "integration"
-        ]
-        
-        return [agent_type for agent_type in agent_types 
-                if os.path.exists(f".aider.agent.{agent_type}.md")]
+        existing_files = self._list_agent_files()
+        return [agent_type for agent_type, filename in AGENT_FILES
+                if filename in existing_files]
+
+    def _list_agent_files(self):
+        """Get names of agent files in the current folder with a single directory scan."""
+        with os.scandir('.') as entries:
+            return {entry.name for entry in entries 
+                    if entry.name.startswith('.aider.agent.')}
         
     async def _execute_agent_cycle(self, agent_name, mission_filepath, model="gpt-4o-mini"):
         """Execute a single agent cycle."""
@@ -2,10 +2,98 @@ import os
 import sys
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from utils.logger import Logger
+from utils.fs_utils import FSUtils
+from utils.openai_client import get_openai_client
 import openai
 from dotenv import load_dotenv
 
+# Agent types generated for every mission, in generation order
+AGENT_TYPES = (
+    "specification",
+    "management",
+    "writing",
+    "evaluation",
+    "deduplication",
+    "chronicler",
+    "redundancy",
+    "production",
+    "researcher",
+    "integration"
+)
+
+# Static system prompt for agent generation, built once at import
+AGENT_GENERATOR_SYSTEM_PROMPT = """
+# KinOS Agent Generator
+
+You create strategic role definitions for KinOS agents by applying specialized analysis frameworks.
+
+## Operational Context
+- Agent operates through Aider file operations
+- Main loop handles all triggers and timing
+- Single-step file modifications only
+- Directory-based mission scope
+
+## Framework Integration
+1. Question Analysis
+   - Process each framework section
+   - Extract relevant guidelines
+   - Apply to current context
+
+2. Role Mapping
+   - Map responsibilities to framework sections
+   - Align capabilities with framework requirements
+   - Define boundaries using framework structure
+
+3. Planning Through Framework
+   - Use framework sections as planning guides
+   - Ensure comprehensive coverage
+   - Maintain framework-aligned validation
+
+## Core Requirements
+1. Mission Contribution
+   - Framework-guided responsibilities
+   - Framework-aligned success metrics
+   - Quality standards from framework
+
+2. Team Integration
+   - Framework-based coordination
+   - Shared objective alignment
+   - Quality interdependencies
+
+Remember: 
+- Answer framework questions practically
+- Keep focus on achievable file operations
+- Use framework to structure planning
+- Maintain mission alignment
+"""
+
+@lru_cache(maxsize=None)
+def _get_prompt_path(agent_name):
+    """
+    Get the path of the prompt template for an agent type.
+    
+    The result only depends on the agent name and the installation directory,
+    so it is memoized for the lifetime of the process.
+    
+    Args:
+        agent_name (str): Agent type
+        
+    Returns:
+        str: Path to prompts/<agent_name>.md in the KinOS installation
+    """
+    # Get the KinOS installation directory
+    if getattr(sys, 'frozen', False):
+        # If running as compiled executable
+        install_dir = os.path.dirname(sys.executable)
+    else:
+        # If running from source
+        install_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        
+    # Look for prompts in the installation directory
+    return os.path.join(install_dir, "prompts", f"{agent_name}.md")
+
 class AgentsManager:
     """Manager class for handling agents and their operations."""
     
@@ -37,27 +125,24 @@ class AgentsManager:
                 self.logger.info("\n📝 The mission file must contain your project description.")
                 raise SystemExit(1)
                 
-            # List of specific agent types
-            agent_types = [
-                "specification",
-                "management", 
-                "writing",
-                "evaluation",
-                "deduplication",
-                "chronicler",
-                "redundancy",
-                "production",
-                "researcher",
-                "integration"
-            ]
+            loop = asyncio.get_running_loop()
             
-            # Create tasks for parallel execution
-            tasks = []
-            for agent_type in agent_types:
-                tasks.append(self._generate_single_agent_async(agent_type))
+            # One worker per agent so every GPT call runs at once; the pool
+            # is reused for all blocking I/O of this run and shut down after
+            with ThreadPoolExecutor(max_workers=len(AGENT_TYPES)) as executor:
+                # Load mission content once and share it with every agent
+                mission_content = await loop.run_in_executor(
+                    executor,
+                    self._read_mission_content
+                )
                 
-            # Execute all tasks in parallel and wait for completion
-            await asyncio.gather(*tasks)
+                # Create tasks for parallel execution
+                tasks = []
+                for agent_type in AGENT_TYPES:
+                    tasks.append(self._generate_single_agent_async(agent_type, mission_content, executor))
+                    
+                # Execute all tasks in parallel and wait for completion
+                await asyncio.gather(*tasks)
             
         except Exception as e:
             self.logger.error(f"❌ Agent generation failed: {str(e)}")
@@ -70,44 +155,42 @@ class AgentsManager:
         Returns:
             bool: True if file is valid, False otherwise
         """
-        try:
-            return os.path.exists(self.mission_path) and os.access(self.mission_path, os.R_OK)
-        except Exception as e:
-            self.logger.error(f"⚠️ Error validating mission file: {str(e)}")
+        if not self.mission_path:
             return False
+        return os.path.exists(self.mission_path) and os.access(self.mission_path, os.R_OK)
         
-    async def _generate_single_agent_async(self, agent_name):
+    async def _generate_single_agent_async(self, agent_name, mission_content, executor):
         """
         Asynchronous version of _generate_single_agent.
+        
+        Args:
+            agent_name (str): Agent type to generate
+            mission_content (str): Mission text shared by all agents
+            executor (ThreadPoolExecutor): Pool of the current generation run
         """
         try:
-            # Use ThreadPoolExecutor for CPU-bound operations
-            with ThreadPoolExecutor() as pool:
-                # Load mission content
-                mission_content = await asyncio.get_event_loop().run_in_executor(
-                    pool,
-                    self._read_mission_content
-                )
-                
-                # Create agent prompt
-                prompt = self._create_agent_prompt(agent_name, mission_content)
-                self.logger.debug(f"📝 Created prompt for agent: {agent_name}")
-                
-                # Make GPT call and get response
-                agent_config = await asyncio.get_event_loop().run_in_executor(
-                    pool,
-                    lambda: self._call_gpt(prompt)
-                )
-                self.logger.debug(f"🤖 Received GPT response for agent: {agent_name}")
-                
-                # Save agent configuration
-                output_path = f".aider.agent.{agent_name}.md"
-                await asyncio.get_event_loop().run_in_executor(
-                    pool,
-                    lambda: self._save_agent_config(output_path, agent_config)
-                )
-                
-                self.logger.success(f"✨ Agent {agent_name} successfully generated")
+            # Run blocking I/O on the generation run's thread pool
+            loop = asyncio.get_running_loop()
+            
+            # Create agent prompt
+            prompt = self._create_agent_prompt(agent_name, mission_content)
+            self.logger.debug(f"📝 Created prompt for agent: {agent_name}")
+            
+            # Make GPT call and get response
+            agent_config = await loop.run_in_executor(
+                executor,
+                lambda: self._call_gpt(prompt)
+            )
+            self.logger.debug(f"🤖 Received GPT response for agent: {agent_name}")
+            
+            # Save agent configuration
+            output_path = f".aider.agent.{agent_name}.md"
+            await loop.run_in_executor(
+                executor,
+                lambda: self._save_agent_config(output_path, agent_config)
+            )
+            
+            self.logger.success(f"✨ Agent {agent_name} successfully generated")
                 
         except Exception as e:
             self.logger.error(f"Failed to generate agent {agent_name}: {str(e)}")
@@ -120,8 +203,7 @@ class AgentsManager:
 
     def _save_agent_config(self, output_path, content):
         """Helper method to save agent configuration."""
-        with open(output_path, 'w') as f:
-            f.write(content)
+        FSUtils.write_file_atomic(output_path, content)
 
     def _create_agent_prompt(self, agent_name, mission_content):
         """
@@ -134,30 +216,23 @@ class AgentsManager:
         Returns:
             str: Detailed prompt for agent generation
         """
-        # Get the KinOS installation directory
-        if getattr(sys, 'frozen', False):
-            # If running as compiled executable
-            install_dir = os.path.dirname(sys.executable)
-        else:
-            # If running from source
-            install_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            
-        # Look for prompts in the installation directory
-        prompt_path = os.path.join(install_dir, "prompts", f"{agent_name}.md")
+        prompt_path = _get_prompt_path(agent_name)
         self.logger.debug(f"Looking for prompt at: {prompt_path}")
         
         custom_prompt = ""
     
-        if os.path.exists(prompt_path):
-            try:
-                with open(prompt_path, 'r', encoding='utf-8') as f:
-                    custom_prompt = f.read()
-                if not custom_prompt.strip():
-                    raise ValueError(f"Prompt file {prompt_path} exists but is empty")
-                self.logger.info(f"📝 Using custom prompt template for {agent_name}")
-            except Exception as e:
-                self.logger.error(f"❌ Failed to load prompt for {agent_name}: {str(e)}")
-                raise ValueError(f"Could not load required prompt file {prompt_path}: {str(e)}")
+        # Open directly; a missing template simply means no custom prompt
+        try:
+            with open(prompt_path, 'r', encoding='utf-8') as f:
+                custom_prompt = f.read()
+            if not custom_prompt.strip():
+                raise ValueError(f"Prompt file {prompt_path} exists but is empty")
+            self.logger.info(f"📝 Using custom prompt template for {agent_name}")
+        except FileNotFoundError:
+            custom_prompt = ""
+        except Exception as e:
+            self.logger.error(f"❌ Failed to load prompt for {agent_name}: {str(e)}")
+            raise ValueError(f"Could not load required prompt file {prompt_path}: {str(e)}")
 
         # Ensure we're getting the complete mission content
         self.logger.debug(f"Mission content length: {len(mission_content)} characters")
@@ -227,101 +302,15 @@ Example Sections:
         try:
             self.logger.debug("\n🤖 AGENT CONFIGURATION PROMPT:")
             self.logger.debug("=== System Message ===")
-            self.logger.debug("""
-# KinOS Agent Generator
-
-You create strategic role definitions for KinOS agents by applying specialized analysis frameworks.
-
-## Operational Context
-- Agent operates through Aider file operations
-- Main loop handles all triggers and timing
-- Single-step file modifications only
-- Directory-based mission scope
-
-## Framework Integration
-1. Question Analysis
-   - Process each framework section
-   - Extract relevant guidelines
-   - Apply to current context
-
-2. Role Mapping
-   - Map responsibilities to framework sections
-   - Align capabilities with framework requirements
-   - Define boundaries using framework structure
-
-3. Planning Through Framework
-   - Use framework sections as planning guides
-   - Ensure comprehensive coverage
-   - Maintain framework-aligned validation
-
-## Core Requirements
-1. Mission Contribution
-   - Framework-guided responsibilities
-   - Framework-aligned success metrics
-   - Quality standards from framework
-
-2. Team Integration
-   - Framework-based coordination
-   - Shared objective alignment
-   - Quality interdependencies
-
-Remember: 
-- Answer framework questions practically
-- Keep focus on achievable file operations
-- Use framework to structure planning
-- Maintain mission alignment
-""")
+            self.logger.debug(AGENT_GENERATOR_SYSTEM_PROMPT)
             self.logger.debug("\n=== User Message ===")
             self.logger.debug(prompt)
 
-            client = openai.OpenAI()
+            client = get_openai_client()
             response = client.chat.completions.create(
                 model="gpt-4o",  # Using the BIG Omni model!
                 messages=[
-                    {"role": "system", "content": """
-# KinOS Agent Generator
-
-You create strategic role definitions for KinOS agents by applying specialized analysis frameworks.
-
-## Operational Context
-- Agent operates through Aider file operations
-- Main loop handles all triggers and timing
-- Single-step file modifications only
-- Directory-based mission scope
-
-## Framework Integration
-1. Question Analysis
-   - Process each framework section
-   - Extract relevant guidelines
-   - Apply to current context
-
-2. Role Mapping
-   - Map responsibilities to framework sections
-   - Align capabilities with framework requirements
-   - Define boundaries using framework structure
-
-3. Planning Through Framework
-   - Use framework sections as planning guides
-   - Ensure comprehensive coverage
-   - Maintain framework-aligned validation
-
-## Core Requirements
-1. Mission Contribution
-   - Framework-guided responsibilities
-   - Framework-aligned success metrics
-   - Quality standards from framework
-
-2. Team Integration
-   - Framework-based coordination
-   - Shared objective alignment
-   - Quality interdependencies
-
-Remember: 
-- Answer framework questions practically
-- Keep focus on achievable file operations
-- Use framework to structure planning
-- Maintain mission alignment
-"""},
+                    {"role": "system", "content": AGENT_GENERATOR_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.4,
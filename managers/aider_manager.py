@@ -1,14 +1,109 @@
 import os
 import time
-import json
 import asyncio
 import subprocess
 from utils.logger import Logger
 from utils.fs_utils import FSUtils
 from utils.encoding_utils import EncodingUtils
-from pathlib import Path
 from managers.vision_manager import VisionManager
 
+# Vendored aider checkout, resolved once relative to the KinOS install
+AIDER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'vendor', 'aider')
+
+# Conventional commit prefixes and the emoji shown for each
+COMMIT_TYPES = {
+    # Core Changes
+    'feat': '✨',
+    'fix': '🐛',
+    'refactor': '♻️',
+    'perf': '⚡️',
+    
+    # Documentation & Style
+    'docs': '📚',
+    'style': '💎',
+    'ui': '🎨',
+    'content': '📝',
+    
+    # Testing & Quality
+    'test': '🧪',
+    'qual': '✅',
+    'lint': '🔍',
+    'bench': '📊',
+    
+    # Infrastructure
+    'build': '📦',
+    'ci': '🔄',
+    'deploy': '🚀',
+    'env': '🌍',
+    'config': '⚙️',
+    
+    # Maintenance
+    'chore': '🔧',
+    'clean': '🧹',
+    'deps': '📎',
+    'revert': '⏪',
+    
+    # Security & Data
+    'security': '🔒',
+    'auth': '🔑',
+    'data': '💾',
+    'backup': '💿',
+    
+    # Project Management
+    'init': '🎉',
+    'release': '📈',
+    'break': '💥',
+    'merge': '🔀',
+    
+    # Special Types
+    'wip': '🚧',
+    'hotfix': '🚑',
+    'arch': '🏗️',
+    'api': '🔌',
+    'i18n': '🌐'
+}
+
+# Static map.md maintenance instructions appended after the tree structure
+MAP_MAINTENANCE_INSTRUCTIONS = """
+# Map Maintenance Instructions
+
+Please update map.md to document the project structure. For each folder and file:
+
+## 1. Folder Documentation
+Document each folder with:
+```markdown
+### 📁 folder_name/
+- **Purpose**: Main responsibility
+- **Contains**: What belongs here
+- **Usage**: When to use this folder
+```
+
+## 2. File Documentation
+Document each file with:
+```markdown
+- **filename** (CATEGORY) - Role and purpose in relation to the mission, in relation to the folder. When to use it.
+```
+
+## File Categories:
+- PRIMARY 📊 - Core project files
+- SPEC 📋 - Specifications
+- IMPL ⚙️ - Implementation
+- DOCS 📚 - Documentation
+- CONFIG ⚡ - Configuration
+- UTIL 🛠️ - Utilities
+- TEST 🧪 - Testing
+- DATA 💾 - Data files
+
+## Guidelines:
+1. Focus on clarity and organization
+2. Use consistent formatting
+3. Keep descriptions concise but informative
+4. Ensure all paths are documented
+5. Maintain existing structure in map.md
+
+Update map.md to reflect the current project structure while maintaining its format.
+"""
+
 class AiderManager:
     """Manager class for handling aider operations."""
     
@@ -17,6 +112,7 @@ class AiderManager:
         self.logger = Logger(model=model)
         self._vision_manager = VisionManager()
         self.encoding_utils = EncodingUtils()  # Add encoding utils
+        self.fs_utils = FSUtils()  # Shared for all tree and ignore lookups
         self.model = model
 
     def _validate_repo_visualizer(self):
@@ -194,36 +290,6 @@ class AiderManager:
             
         return True
 
-    def _validate_mission_file(self, mission_filepath):
-        """
-        Validate that mission file exists and is readable.
-        
-        Args:
-            mission_filepath (str): Path to mission file
-            
-        Returns:
-            bool: True if file is valid, False otherwise
-            
-        Side Effects:
-            Logs error messages if validation fails
-        """
-        if not os.path.exists(mission_filepath):
-            self.logger.error("❌ Mission file not found!")
-            self.logger.info("\n📋 To start KinOS, you must:")
-            self.logger.info("   1. Either create a '.aider.mission.md' file in the current folder")
-            self.logger.info("   2. Or specify the path to your mission file with --mission")
-            self.logger.info("\n💡 Examples:")
-            self.logger.info("   kin run agents --generate")
-            self.logger.info("   kin run agents --generate --mission path/to/my_mission.md")
-            self.logger.info("\n📝 The mission file must contain your project description.")
-            return False
-        
-        if not os.access(mission_filepath, os.R_OK):
-            self.logger.error(f"❌ Cannot read mission file: {mission_filepath}")
-            return False
-            
-        return True
-
     def _validate_files(self, *filepaths):
         """Validate that all input files exist and are readable.
         
@@ -252,13 +318,17 @@ class AiderManager:
         """
         try:
             context_files = []
+            ensured_dirs = set()  # Parent folders already created in this pass
             with open(map_filepath, 'r', encoding='utf-8') as f:
                 for line in f:
                     if line.strip().startswith('- '):
                         filepath = line.strip()[2:]
                         if not os.path.exists(filepath):
                             # Create directory structure if needed
-                            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+                            parent_dir = os.path.dirname(filepath)
+                            if parent_dir and parent_dir not in ensured_dirs:
+                                os.makedirs(parent_dir, exist_ok=True)
+                                ensured_dirs.add(parent_dir)
                             # Create empty file
                             with open(filepath, 'w', encoding='utf-8') as new_file:
                                 pass
@@ -284,14 +354,15 @@ class AiderManager:
             list: Command arguments for subprocess
         """
         # Extract agent name from filepath for history files
-        agent_name = os.path.basename(agent_filepath).replace('.aider.agent.', '').replace('.md', '')
+        agent_name = FSUtils.extract_agent_name(agent_filepath, '.aider.agent.')
         
         # Use python -m to execute aider as module
-        aider_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'vendor', 'aider')
         cmd = ["python", "-m", "aider.main"]
         
-        # Add aider path to PYTHONPATH
-        os.environ["PYTHONPATH"] = aider_path + os.pathsep + os.environ.get("PYTHONPATH", "")
+        # Add aider path to PYTHONPATH, once: the environment persists across runs
+        python_path = os.environ.get("PYTHONPATH", "")
+        if AIDER_PATH not in python_path.split(os.pathsep):
+            os.environ["PYTHONPATH"] = AIDER_PATH + os.pathsep + python_path
         
         # Add required aider arguments
         cmd.extend([
@@ -341,62 +412,10 @@ class AiderManager:
             # Fix potential encoding issues
             commit_msg = commit_msg.encode('latin1').decode('utf-8')
             
-            commit_types = {
-            # Core Changes
-            'feat': '✨',
-            'fix': '🐛',
-            'refactor': '♻️',
-            'perf': '⚡️',
-            
-            # Documentation & Style
-            'docs': '📚',
-            'style': '💎',
-            'ui': '🎨',
-            'content': '📝',
-            
-            # Testing & Quality
-            'test': '🧪',
-            'qual': '✅',
-            'lint': '🔍',
-            'bench': '📊',
-            
-            # Infrastructure
-            'build': '📦',
-            'ci': '🔄',
-            'deploy': '🚀',
-            'env': '🌍',
-            'config': '⚙️',
-            
-            # Maintenance
-            'chore': '🔧',
-            'clean': '🧹',
-            'deps': '📎',
-            'revert': '⏪',
-            
-            # Security & Data
-            'security': '🔒',
-            'auth': '🔑',
-            'data': '💾',
-            'backup': '💿',
-            
-            # Project Management
-            'init': '🎉',
-            'release': '📈',
-            'break': '💥',
-            'merge': '🔀',
-            
-            # Special Types
-            'wip': '🚧',
-            'hotfix': '🚑',
-            'arch': '🏗️',
-            'api': '🔌',
-            'i18n': '🌐'
-        }
-        
-            # Check if commit message starts with any known type
-            for commit_type, emoji in commit_types.items():
-                if commit_msg.lower().startswith(f"{commit_type}:"):
-                    return commit_type, emoji
+            # Look up the prefix before the first colon, e.g. "feat: ..."
+            commit_type, sep, _ = commit_msg.lower().partition(':')
+            if sep and commit_type in COMMIT_TYPES:
+                return commit_type, COMMIT_TYPES[commit_type]
                     
             # Default to other
             return "other", "🔨"
@@ -404,10 +423,6 @@ class AiderManager:
         except UnicodeError as e:
             self.logger.warning(f"⚠️ Encoding issue with commit message: {str(e)}")
             return "other", "🔨"
-            
-        except UnicodeError as e:
-            self.logger.warning(f"⚠️ Encoding issue with commit message: {str(e)}")
-            return "other", "🔨"
 
     def _get_git_file_states(self):
         """Get dictionary of tracked files and their current hash."""
@@ -443,10 +458,7 @@ class AiderManager:
             before_hash = before_state.get(file_path)
             if before_hash != after_hash:
                 modified_files.append(file_path)
-                self.logger.debug(f"🔍 Detected change in {file_path}")
-                self.logger.debug(f"  Before hash: {before_hash}")
-                self.logger.debug(f"  After hash: {after_hash}")
-                self.logger.debug(f"📝 Modified file: {file_path}")
+                self.logger.debug(f"📝 Modified file: {file_path} ({before_hash} -> {after_hash})")
         
         return modified_files
 
@@ -468,8 +480,8 @@ class AiderManager:
 
     async def _run_aider_phase(self, cmd, agent_name, phase_name, phase_prompt):
         """Run a single aider phase and handle its results."""
-        phase_start = time.time()
-        self.logger.info(f"{phase_name} Agent {agent_name} starting phase at {phase_start}")
+        phase_start = time.monotonic()
+        self.logger.info(f"{phase_name} Agent {agent_name} starting phase at {time.time()}")
         
         # Prepare command with phase-specific prompt
         phase_cmd = cmd.copy()
@@ -532,7 +544,7 @@ class AiderManager:
                     error_msg = e.stderr.encode('utf-8', errors='replace').decode('utf-8')
                     self.logger.info(f"💡 Git push skipped: {error_msg.strip()}")
         
-            phase_end = time.time()
+            phase_end = time.monotonic()
             self.logger.info(f"✨ Agent {agent_name} completed {phase_name} phase in {phase_end - phase_start:.2f} seconds")
         
             return modified_files, final_state
@@ -566,62 +578,11 @@ class AiderManager:
             self.logger.debug(f"Added tree structure with {len(tree_structure)} lines")
 
         # Core prompt content
-        prompt = f"""{structure_section}
-# Map Maintenance Instructions
-
-Please update map.md to document the project structure. For each folder and file:
-
-## 1. Folder Documentation
-Document each folder with:
-```markdown
-### 📁 folder_name/
-- **Purpose**: Main responsibility
-- **Contains**: What belongs here
-- **Usage**: When to use this folder
-```
-
-## 2. File Documentation
-Document each file with:
-```markdown
-- **filename** (CATEGORY) - Role and purpose in relation to the mission, in relation to the folder. When to use it.
-```
-
-## File Categories:
-- PRIMARY 📊 - Core project files
-- SPEC 📋 - Specifications
-- IMPL ⚙️ - Implementation
-- DOCS 📚 - Documentation
-- CONFIG ⚡ - Configuration
-- UTIL 🛠️ - Utilities
-- TEST 🧪 - Testing
-- DATA 💾 - Data files
-
-## Guidelines:
-1. Focus on clarity and organization
-2. Use consistent formatting
-3. Keep descriptions concise but informative
-4. Ensure all paths are documented
-5. Maintain existing structure in map.md
-
-Update map.md to reflect the current project structure while maintaining its format.
-"""
+        prompt = structure_section + MAP_MAINTENANCE_INSTRUCTIONS
 
         self.logger.debug("Generated map maintenance prompt")
         return prompt
 
-    def _get_complete_tree(self):
-        """Get complete tree structure without depth limit."""
-        fs_utils = FSUtils()
-        current_path = "."
-        files = fs_utils.get_folder_files(current_path)
-        subfolders = fs_utils.get_subfolders(current_path)
-        return fs_utils.build_tree_structure(
-            current_path=current_path,
-            files=files,
-            subfolders=subfolders,
-            max_depth=None  # No depth limit
-        )
-
     async def _execute_aider(self, cmd):
         """Execute aider command and handle results."""
         try:
@@ -633,12 +594,12 @@ Update map.md to reflect the current project structure while maintaining its for
             agent_name = None
             for i, arg in enumerate(cmd):
                 if "--chat-history-file" in arg and i+1 < len(cmd):
-                    agent_name = cmd[i+1].replace('.aider.history.', '').replace('.md', '')
+                    agent_name = FSUtils.extract_agent_name(cmd[i+1], '.aider.history.')
                     break
 
             # Log start time
-            start_time = time.time()
-            self.logger.info(f"⏳ Agent {agent_name} starting aider execution at {start_time}")
+            start_time = time.monotonic()
+            self.logger.info(f"⏳ Agent {agent_name} starting aider execution at {time.time()}")
 
             # Run production phase
             production_files, production_state = await self._run_aider_phase(
@@ -665,7 +626,7 @@ Update map.md to reflect the current project structure while maintaining its for
             all_changes.update(final_files or [])
 
             # Log total duration and summary
-            total_duration = time.time() - start_time
+            total_duration = time.monotonic() - start_time
             self.logger.info(f"🎯 Agent {agent_name} completed total aider execution in {total_duration:.2f} seconds")
             
             if all_changes:
@@ -681,15 +642,15 @@ Update map.md to reflect the current project structure while maintaining its for
     def run_map_maintenance_for_all_folders(self):
         """Run map maintenance for each folder in the repository."""
         self.logger.debug("Starting map maintenance for all folders...")
-        fs_utils = FSUtils()
-        ignore_patterns = fs_utils._get_ignore_patterns()
+        fs_utils = self.fs_utils
+        ignore_regex = fs_utils._get_ignore_regex()
 
         for root, dirs, _ in os.walk('.'):
             # Filter out ignored directories, especially .git and .aider folders
+            # (cheap prefix test first so .git/.aider skip the join and regex)
             dirs[:] = [d for d in dirs 
-                      if not fs_utils._should_ignore(os.path.join(root, d), ignore_patterns) 
-                      and not d.startswith('.git')  # Explicitly exclude .git folders
-                      and not d.startswith('.aider')]  # Explicitly exclude .aider folders
+                      if not d.startswith(('.git', '.aider'))  # Explicitly exclude .git and .aider folders
+                      and not fs_utils._should_ignore(os.path.join(root, d), ignore_regex)]
             
             for dir_name in dirs:
                 folder_path = os.path.join(root, dir_name)
@@ -702,11 +663,10 @@ Update map.md to reflect the current project structure while maintaining its for
         
         try:
             # Get the COMPLETE tree structure starting from root
-            fs_utils = FSUtils()
+            fs_utils = self.fs_utils
             fs_utils.set_current_folder(folder_path)  # Set current folder before building tree
         
-            root_files = fs_utils.get_folder_files(".")
-            root_subfolders = fs_utils.get_subfolders(".")
+            root_files, root_subfolders = fs_utils.get_folder_entries(".")
             tree_structure = fs_utils.build_tree_structure(
                 current_path=".",  # Start from root
                 files=root_files,
@@ -722,7 +682,7 @@ Update map.md to reflect the current project structure while maintaining its for
             self.logger.debug(f"Generated map maintenance prompt:\n{map_prompt}")
 
             # Execute aider with the generated prompt
-            aider_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'vendor', 'aider')
+            aider_path = AIDER_PATH
             cmd = ["python", os.path.join(aider_path, "aider")]
             cmd.extend([
                 "--model", "gpt-4o-mini",
@@ -1,8 +1,8 @@
 import os
-import asyncio
-import openai
+import base64
 import requests
 from utils.logger import Logger
+from utils.openai_client import get_openai_client
 from utils.fs_utils import FSUtils
 from managers.aider_manager import AiderManager
 from managers.vision_manager import VisionManager
@@ -269,7 +269,7 @@ Process this objective to be more specific and actionable while maintaining alig
             self.logger.debug("\n🔍 GPT SYSTEM PROMPT:\n" + system_prompt)
             self.logger.debug("\n🔍 GPT USER PROMPT:\n" + user_prompt)
             
-            client = openai.OpenAI()
+            client = get_openai_client()
             response = client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
@@ -308,23 +308,22 @@ Process this objective to be more specific and actionable while maintaining alig
                 raise ValueError("No processed objective provided for file context analysis")
 
             # Get complete repository structure with actual files
-            fs_utils = FSUtils()
             files = []
-            for root, _, filenames in os.walk('.'):
-                # Skip .git folder but allow other dot files/folders
-                if '.git' not in root.split(os.sep):
-                    for filename in filenames:
-                        full_path = os.path.join(root, filename)
-                        rel_path = os.path.relpath(full_path, '.').replace(os.sep, '/')
-                        files.append(f"- ./{rel_path}")
+            for root, dirs, filenames in os.walk('.'):
+                # Skip .git folder without descending into it, but allow other dot files/folders
+                dirs[:] = [d for d in dirs if d != '.git']
+                for filename in filenames:
+                    full_path = os.path.join(root, filename)
+                    rel_path = os.path.relpath(full_path, '.').replace(os.sep, '/')
+                    files.append(f"- ./{rel_path}")
 
             # Create tree text with all files
             tree_text = "\n".join(sorted(files)) if files else "No existing files"
             
             self.logger.debug(f"\n🌳 Available files:\n{tree_text}")
 
-            # Generate fresh visualization
-            await self.vision_manager.generate_visualization()
+            # diagram.png was already refreshed at the start of _planning_phase
+            # and nothing has touched the repository since, so reuse it
 
             # Initialize messages list
             messages = [
@@ -349,7 +348,6 @@ Rules:
                 try:
                     with open('./diagram.png', 'rb') as f:
                         diagram_content = f.read()
-                    import base64
                     encoded_bytes = base64.b64encode(diagram_content).decode('utf-8')
                     messages.append({
                         "role": "user",
@@ -403,7 +401,7 @@ Respond with the two file lists as shown in the format above."""
             # Make API call with explicit error handling
             try:
                 self.logger.info("🔍 Analyzing file context with GPT...")
-                client = openai.OpenAI()
+                client = get_openai_client()
                 response = client.chat.completions.create(
                     model=self.model,
                     messages=messages,
@@ -1,6 +1,9 @@
 import os
+import base64
 import requests
+from collections import deque
 from utils.logger import Logger
+from utils.openai_client import get_openai_client
 from utils.encoding_utils import EncodingUtils
 from utils.fs_utils import FSUtils
 import openai
@@ -18,8 +21,15 @@ class ObjectiveManager:
         if not openai.api_key:
             raise ValueError("OpenAI API key not found in environment variables")
         
-        # Load mission content
-        self.mission_content = self._load_mission_content()
+        # Mission context is loaded on first use (see mission_content)
+        self._mission_content = None
+
+    @property
+    def mission_content(self):
+        """Mission text, read from .aider.mission.md the first time it is needed."""
+        if self._mission_content is None:
+            self._mission_content = self._load_mission_content()
+        return self._mission_content
 
     def generate_objective(self, mission_filepath=".aider.mission.md", agent_filepath=None):
         """
@@ -82,8 +92,7 @@ class ObjectiveManager:
 
     def _extract_agent_name(self, agent_filepath):
         """Extract agent name from filepath."""
-        basename = os.path.basename(agent_filepath)
-        return basename.replace('.aider.agent.', '').replace('.md', '')
+        return FSUtils.extract_agent_name(agent_filepath, '.aider.agent.')
 
 
     def _read_file(self, filepath):
@@ -93,51 +102,53 @@ class ObjectiveManager:
     def _generate_objective_content(self, mission_content, agent_content, agent_name):
         """Generate objective content using GPT."""
         try:
-            client = openai.OpenAI()
+            client = get_openai_client()
 
             # Build list of all file paths
             files = []
-            for root, _, filenames in os.walk('.'):
-                # Skip any folder that starts with .
-                if not any(part.startswith('.') for part in root.split(os.sep)[1:]):
-                    for filename in filenames:
-                        # Skip files that start with . or .aider
-                        if not (filename.startswith('.') or filename.startswith('.aider')):
-                            full_path = os.path.join(root, filename)
-                            rel_path = os.path.relpath(full_path, '.').replace(os.sep, '/')
-                            files.append(f"- ./{rel_path}")
+            for root, dirs, filenames in os.walk('.'):
+                # Skip any folder that starts with . without descending into it
+                dirs[:] = [d for d in dirs if not d.startswith('.')]
+                for filename in filenames:
+                    # Skip dot files (this includes .aider*)
+                    if not filename.startswith('.'):
+                        full_path = os.path.join(root, filename)
+                        rel_path = os.path.relpath(full_path, '.').replace(os.sep, '/')
+                        files.append(f"- ./{rel_path}")
 
             # Create sorted list of paths
             tree_text = "\n".join(sorted(files)) if files else "No existing files"
 
             # Read last 80 lines from suivi.md if it exists
             suivi_content = ""
-            if os.path.exists('suivi.md'):
-                try:
-                    with open('suivi.md', 'r', encoding='utf-8') as f:
-                        lines = f.readlines()
-                        last_lines = lines[-80:] if len(lines) > 80 else lines
-                        suivi_content = ''.join(last_lines)
-                except Exception as e:
-                    self.logger.warning(f"⚠️ Could not read suivi.md: {str(e)}")
+            try:
+                with open('suivi.md', 'r', encoding='utf-8') as f:
+                    # Stream the file, keeping only the tail in memory
+                    suivi_content = ''.join(deque(f, maxlen=80))
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                self.logger.warning(f"⚠️ Could not read suivi.md: {str(e)}")
 
             # Read todolist.md if it exists
             todolist = ""
-            if os.path.exists('todolist.md'):
-                try:
-                    with open('todolist.md', 'r', encoding='utf-8') as f:
-                        todolist = f.read()
-                except Exception as e:
-                    self.logger.warning(f"⚠️ Could not read todolist.md: {str(e)}")
+            try:
+                with open('todolist.md', 'r', encoding='utf-8') as f:
+                    todolist = f.read()
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                self.logger.warning(f"⚠️ Could not read todolist.md: {str(e)}")
 
-            # Read and encode diagram.png if it exists
+            # Read diagram.png once; it is reused for the file context request
             diagram_content = None
-            if os.path.exists('./diagram.png'):
-                try:
-                    with open('./diagram.png', 'rb') as f:
-                        diagram_content = f.read()
-                except Exception as e:
-                    self.logger.warning(f"⚠️ Could not read diagram.png: {str(e)}")
+            try:
+                with open('./diagram.png', 'rb') as f:
+                    diagram_content = f.read()
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                self.logger.warning(f"⚠️ Could not read diagram.png: {str(e)}")
 
             # Check for Perplexity API key
             perplexity_key = os.getenv('PERPLEXITY_API_KEY')
@@ -257,11 +268,8 @@ Project structure
 ````
 """
             # Add diagram if available
-            if os.path.exists('./diagram.png'):
+            if diagram_content:
                 try:
-                    with open('./diagram.png', 'rb') as f:
-                        diagram_content = f.read()
-                    import base64
                     encoded_bytes = base64.b64encode(diagram_content).decode('utf-8')
                     file_context_prompt = f"""
 [A visual diagram of the project structure is attached to help inform your decisions]
@@ -354,7 +362,6 @@ Respond only with the file lists in the format shown above.
             # Add diagram if available
             if diagram_content:
                 try:
-                    import base64
                     # Encode bytes to base64
                     encoded_bytes = base64.b64encode(diagram_content).decode('utf-8')
                     messages.append({
@@ -394,7 +401,7 @@ Respond only with the file lists in the format shown above.
     def _generate_summary(self, objective, agent_name, agent_content):
         """Generate a one-line summary of the objective."""
         try:
-            client = openai.OpenAI()
+            client = get_openai_client()
             prompt = f'''
 Mission Context
 ================
@@ -445,7 +452,7 @@ In this context, you are an assistant who summarizes project actions in a concis
     def _generate_research_summary(self, query, result, agent_name, agent_content):
         """Generate a summary of the Perplexity research results."""
         try:
-            client = openai.OpenAI()
+            client = get_openai_client()
             prompt = f'''
 Search Query 
 ================
@@ -503,7 +510,7 @@ In this context, you are an assistant who summarizes project actions in a concis
         """Save objective content to file, including Perplexity research results if needed."""
         try:
             # Extract agent name from filepath
-            agent_name = os.path.basename(filepath).replace('.aider.objective.', '').replace('.md', '')
+            agent_name = FSUtils.extract_agent_name(filepath, '.aider.objective.')
             
             # Check for research requirement
             if "Search:" in content:
@@ -552,9 +559,12 @@ In this context, you are an assistant who summarizes project actions in a concis
                             self.logger.success(research_summary)
                             
                             # Add research results to objective
-                            content += "\n\n## Additional Information\n"
-                            content += f"Perplexity search results for: {research_query}\n\n"
-                            content += research_result
+                            content = "".join([
+                                content,
+                                "\n\n## Additional Information\n",
+                                f"Perplexity search results for: {research_query}\n\n",
+                                research_result
+                            ])
                         else:
                             error_msg = f"Perplexity API call failed with status {response.status_code}"
                             if response.text:
@@ -566,8 +576,7 @@ In this context, you are an assistant who summarizes project actions in a concis
                         # Continue without research results
             
             # Save updated content with UTF-8 encoding
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+            FSUtils.write_file_atomic(filepath, content)
                 
         except Exception as e:
             self.logger.error(f"Error saving objective to {filepath}: {str(e)}")
@@ -3,6 +3,10 @@ import subprocess
 import asyncio
 from utils.logger import Logger
 
+# Vendored repo-visualizer build, resolved once at import
+REPO_VISUALIZER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'vendor', 'repo-visualizer')
+REPO_VISUALIZER_SCRIPT = os.path.join(REPO_VISUALIZER_PATH, 'dist', 'index.js')
+
 class VisionManager:
     """Manager class for repository visualization using repo-visualizer."""
     
@@ -33,9 +37,7 @@ class VisionManager:
                     "Node.js not found! Please install Node.js from https://nodejs.org/"
                 )
 
-            # Get repo-visualizer path
-            repo_visualizer_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'vendor', 'repo-visualizer')
-            dist_path = os.path.join(repo_visualizer_path, 'dist', 'index.js')
+            dist_path = REPO_VISUALIZER_SCRIPT
 
             if not os.path.exists(dist_path):
                 raise FileNotFoundError(
@@ -1,11 +1,6 @@
 import sys
 import logging
 import asyncio
-from managers.agents_manager import AgentsManager
-from managers.objective_manager import ObjectiveManager
-from managers.aider_manager import AiderManager
-from managers.agent_runner import AgentRunner
-from utils.logger import Logger
 
 def main():
     if len(sys.argv) < 2:
@@ -31,11 +26,13 @@ def main():
 
         subcommand = sys.argv[2]
         if subcommand == "map":
+            from managers.aider_manager import AiderManager
             manager = AiderManager()
             manager.logger.logger.setLevel(logging.DEBUG)  # Set log level to DEBUG
             manager.run_map_maintenance_for_all_folders()
             
         elif subcommand == "agents":
+            from managers.agents_manager import AgentsManager
             manager = AgentsManager(model=model)
             # Optional mission file path
             mission_path = sys.argv[3] if len(sys.argv) > 3 else ".aider.mission.md"
@@ -45,6 +42,7 @@ def main():
             from managers.vision_manager import VisionManager
             manager = VisionManager()
             asyncio.run(manager.generate_visualization())
+            from managers.objective_manager import ObjectiveManager
             manager = ObjectiveManager()
             
             # Parse arguments
@@ -75,19 +73,14 @@ def main():
             
         subcommand = sys.argv[2]
         if subcommand == "agents":
+            from managers.agent_runner import AgentRunner
+            from utils.logger import Logger
+            
             # Create and initialize runner asynchronously
             async def init_and_run_agents():
-                # Get model name
-                run_model = "gpt-4o-mini"  # Default value
-                if "--model" in sys.argv:
-                    try:
-                        model_index = sys.argv.index("--model") + 1
-                        run_model = sys.argv[model_index]
-                    except (ValueError, IndexError):
-                        print("Invalid value for --model. Using default (gpt-4o-mini)")
-
                 # Use the factory method to create and initialize the runner
-                runner = await AgentRunner.create(model=run_model)
+                # (model was already parsed from --model above)
+                runner = await AgentRunner.create(model=model)
                 
                 # Set global log level based on verbose flag
                 if "--verbose" in sys.argv:
@@ -115,15 +108,6 @@ def main():
                     except (ValueError, IndexError):
                         print("Invalid value for --count. Using default (5)")
 
-                # Get model name
-                model = "gpt-4o-mini"  # Default value
-                if "--model" in sys.argv:
-                    try:
-                        model_index = sys.argv.index("--model") + 1
-                        model = sys.argv[model_index]
-                    except (ValueError, IndexError):
-                        print("Invalid value for --model. Using default (gpt-4o-mini)")
-                
                 # Check for --generate flag    
                 should_generate = "--generate" in sys.argv
                 
@@ -142,6 +126,7 @@ def main():
             asyncio.run(init_and_run_agents())
             
         elif subcommand == "aider":
+            from managers.aider_manager import AiderManager
             manager = AiderManager()
             
             # Parse arguments
@@ -1,6 +1,10 @@
 import os
-import fnmatch
+import re
 from utils.logger import Logger
+from utils.fs_utils import read_ignore_file, _compile_ignore_patterns
+
+# Lines whose first non-whitespace character is '#' (markdown headers)
+_HEADER_LINE = re.compile(r'^[^\S\n]*#', re.MULTILINE)
 
 class ContentSplitter:
     """
@@ -69,12 +73,16 @@ class ContentSplitter:
             
         # Check .gitignore patterns
         ignore_patterns = self._get_ignore_patterns()
-        rel_path = os.path.relpath(file_path)
-        for pattern in ignore_patterns:
-            if fnmatch.fnmatch(rel_path, pattern):
-                return True
-                
-        return False
+        if not ignore_patterns:
+            return False
+            
+        # Relative paths only need normalizing; relpath is kept for absolute ones
+        if os.path.isabs(file_path):
+            rel_path = os.path.relpath(file_path)
+        else:
+            rel_path = os.path.normpath(file_path)
+        ignore_regex = _compile_ignore_patterns(tuple(ignore_patterns))
+        return ignore_regex.match(os.path.normcase(rel_path)) is not None
 
     def _get_ignore_patterns(self):
         """
@@ -87,14 +95,11 @@ class ContentSplitter:
             list: List of gitignore patterns to exclude
             
         Note:
-            Ignores comment lines and empty lines in .gitignore
+            Ignores comment lines and empty lines in .gitignore. Parsing is
+            shared with FSUtils through read_ignore_file, so the file is only
+            re-read when its mtime or size changes.
         """
-        patterns = []
-        if os.path.exists('.gitignore'):
-            with open('.gitignore', 'r') as f:
-                patterns.extend(line.strip() for line in f 
-                              if line.strip() and not line.startswith('#'))
-        return patterns
+        return list(read_ignore_file('.gitignore'))
 
     def _count_sections(self, content):
         """
@@ -109,11 +114,7 @@ class ContentSplitter:
         Returns:
             int: Number of markdown sections found
         """
-        section_count = 0
-        for line in content.split('\n'):
-            if line.strip().startswith('#'):
-                section_count += 1
-        return section_count
+        return sum(1 for _ in _HEADER_LINE.finditer(content))
 
     def _count_paragraphs(self, content):
         """
@@ -132,7 +133,7 @@ class ContentSplitter:
         paragraphs = [p.strip() for p in content.split('\n\n')]
         return len([p for p in paragraphs if p])
 
-    def _needs_splitting(self, file_path):
+    def _read_if_needs_splitting(self, file_path):
         """
         Determine if file needs to be split based on size and content.
         
@@ -145,17 +146,18 @@ class ContentSplitter:
             file_path (str): Path to file to evaluate
             
         Returns:
-            bool: True if file needs splitting, False otherwise
+            str: File content if it needs splitting, None otherwise
             
         Note:
-            Skips protected and ignored files automatically
+            Skips protected and ignored files automatically. The content is
+            returned so callers don't have to read the file a second time.
         """
         if self._should_ignore(file_path):
-            return False
+            return None
             
         # Check file size first
         if os.path.getsize(file_path) < self.MAX_FILE_SIZE:
-            return False
+            return None
             
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
@@ -164,17 +166,17 @@ class ContentSplitter:
             # Check content thresholds
             section_count = self._count_sections(content)
             if section_count > self.SECTION_THRESHOLD:
-                return True
+                return content
                 
             paragraph_count = self._count_paragraphs(content)
             if paragraph_count > self.PARAGRAPH_THRESHOLD:
-                return True
+                return content
                 
         except Exception as e:
             self.logger.error(f"Error analyzing {file_path}: {str(e)}")
-            return False
+            return None
             
-        return False
+        return None
 
     def _create_split_directory(self, file_path):
         """
@@ -238,6 +240,11 @@ class ContentSplitter:
             
         return sections
 
+    def _section_file_name(self, index, section):
+        """Get the file name of a split section, e.g. '01_introduction.md'."""
+        safe_title = section['title'].replace(' ', '_').lower()
+        return f"{index+1:02d}_{safe_title}.md"
+
     def split_file(self, file_path):
         """
         Split a file into smaller chunks if needed.
@@ -265,7 +272,8 @@ class ContentSplitter:
             - Updates cross-references
         """
         try:
-            if not self._needs_splitting(file_path):
+            content = self._read_if_needs_splitting(file_path)
+            if content is None:
                 return False
                 
             self.logger.info(f"🔄 Splitting file: {file_path}")
@@ -274,16 +282,13 @@ class ContentSplitter:
             dir_path = self._create_split_directory(file_path)
             base_name = os.path.splitext(os.path.basename(file_path))[0]
             
-            # Read and split content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Split content already read during analysis
             sections = self._split_content(content, base_name)
             
             # Create index file
             index_content = ["# Index\n"]
             for i, section in enumerate(sections):
-                safe_title = section['title'].replace(' ', '_').lower()
-                file_name = f"{i+1:02d}_{safe_title}.md"
+                file_name = self._section_file_name(i, section)
                 index_content.append(f"- [{section['title']}]({file_name})")
                 
                 # Write section file
@@ -324,12 +329,12 @@ class ContentSplitter:
                 current_content = f.read()
                 
             # Add new section for split files
-            new_content = current_content + "\n\n## Split Files Review\n"
-            for i, section in enumerate(sections):
-                safe_title = section['title'].replace(' ', '_').lower()
-                file_name = f"{i+1:02d}_{safe_title}.md"
-                new_content += f"- [ ] Review and validate {os.path.join(dir_path, file_name)}\n"
-                
+            review_lines = "".join(
+                f"- [ ] Review and validate {os.path.join(dir_path, self._section_file_name(i, section))}\n"
+                for i, section in enumerate(sections)
+            )
+            new_content = f"{current_content}\n\n## Split Files Review\n{review_lines}"
+
             with open(todolist_path, 'w', encoding='utf-8') as f:
                 f.write(new_content)
                 
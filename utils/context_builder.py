@@ -1,8 +1,8 @@
 import os
-import fnmatch
-from pathlib import Path
+import re
 import mimetypes
 from typing import List, Set
+from utils.fs_utils import read_ignore_file, _compile_ignore_patterns
 
 class ContextBuilder:
     """
@@ -57,35 +57,24 @@ class ContextBuilder:
             'Thumbs.db'
         ])
         
-        # Read .gitignore
-        if os.path.exists('.gitignore'):
-            with open('.gitignore', 'r', encoding='utf-8') as f:
-                patterns.extend(line.strip() for line in f 
-                              if line.strip() and not line.startswith('#'))
-                
-        # Read .aiderignore
-        if os.path.exists('.aiderignore'):
-            with open('.aiderignore', 'r', encoding='utf-8') as f:
-                patterns.extend(line.strip() for line in f 
-                              if line.strip() and not line.startswith('#'))
+        # Read .gitignore and .aiderignore
+        patterns.extend(read_ignore_file('.gitignore'))
+        patterns.extend(read_ignore_file('.aiderignore'))
                 
         return patterns
 
-    def _should_ignore(self, file_path: str, ignore_patterns: List[str]) -> bool:
+    def _should_ignore(self, file_path: str, ignore_regex: re.Pattern) -> bool:
         """
         Check if a file should be ignored based on ignore patterns.
         
         Args:
             file_path (str): Path to file to check
-            ignore_patterns (List[str]): List of glob patterns to check against
+            ignore_regex (re.Pattern): Compiled ignore patterns
             
         Returns:
             bool: True if file should be ignored, False otherwise
         """
-        for pattern in ignore_patterns:
-            if fnmatch.fnmatch(file_path, pattern):
-                return True
-        return False
+        return ignore_regex.match(os.path.normcase(file_path)) is not None
 
     def _is_text_file(self, file_path: str) -> bool:
         """
@@ -152,7 +141,8 @@ class ContextBuilder:
             - Includes relative paths to original files
             - Handles text encoding using UTF-8
         """
-        ignore_patterns = self._get_ignore_patterns()
+        # Default patterns are always present, so the combined regex is never empty
+        ignore_regex = _compile_ignore_patterns(tuple(self._get_ignore_patterns()))
         processed_files: Set[str] = set()
         
         with open(output_file, 'w', encoding='utf-8') as out:
@@ -162,7 +152,7 @@ class ContextBuilder:
             for root, dirs, files in os.walk(root_dir):
                 # Remove ignored directories
                 dirs[:] = [d for d in dirs if not self._should_ignore(
-                    os.path.join(root, d), ignore_patterns
+                    os.path.join(root, d), ignore_regex
                 )]
                 
                 for file in files:
@@ -170,7 +160,7 @@ class ContextBuilder:
                     rel_path = os.path.relpath(file_path, root_dir)
                     
                     # Skip if file should be ignored
-                    if self._should_ignore(rel_path, ignore_patterns):
+                    if self._should_ignore(rel_path, ignore_regex):
                         continue
                         
                     # Skip if already processed
@@ -1,11 +1,18 @@
 import os
 import fnmatch
-import chardet
+from collections import OrderedDict
 from utils.logger import Logger
 
+# Maximum number of UTF-8 files kept in the shared read cache
+CONTENT_CACHE_SIZE = 256
+
 class EncodingUtils:
     """Utility class for handling file encodings."""
     
+    # Decoded UTF-8 content shared by all instances:
+    # abs path -> ((st_mtime_ns, st_size), content)
+    _content_cache = OrderedDict()
+    
     def __init__(self, model="gpt-4o-mini"):
         self.logger = Logger(model=model)
         self.model = model
@@ -22,71 +29,77 @@ class EncodingUtils:
             
         Raises:
             Exception: If file cannot be read
+            
+        Note:
+            UTF-8 files are served from a cache while their mtime and size
+            are unchanged
         """
         try:
+            # Serve unchanged files from the cache with a single stat
+            cache_path = os.path.abspath(filepath)
+            stat = os.stat(cache_path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = self._content_cache.get(cache_path)
+            if cached is not None and cached[0] == signature:
+                self._content_cache.move_to_end(cache_path)
+                return cached[1]
+                
+            # Read raw bytes once and decode them in memory
+            with open(filepath, 'rb') as f:
+                content = f.read()
+                
             # First verify if file is already valid UTF-8
             try:
-                with open(filepath, 'rb') as f:
-                    content = f.read()
-                    if content.decode('utf-8'):
-                        # File is already valid UTF-8, read normally
-                        with open(filepath, 'r', encoding='utf-8', newline='') as f:
-                            return f.read()
+                decoded = content.decode('utf-8')
             except UnicodeDecodeError:
                 pass  # Not UTF-8, continue to conversion
+            else:
+                self._cache_content(cache_path, signature, decoded)
+                return decoded
 
             # Try different encodings
             encodings = ['latin-1', 'cp1252', 'iso-8859-1']
             for encoding in encodings:
                 try:
-                    with open(filepath, 'rb') as f:
-                        content = f.read()
                     decoded = content.decode(encoding)
-                    
-                    # Verify this isn't already UTF-8 encoded content
-                    try:
-                        if content.decode('utf-8'):
-                            self.logger.debug(f"File {filepath} is already UTF-8")
-                            return decoded
-                    except UnicodeDecodeError:
-                        # Not UTF-8, safe to convert
-                        # Normalize line endings to system default without duplicating
-                        lines = decoded.splitlines()
-                        utf8_content = os.linesep.join(lines)
-                        
-                        # Only write back if content actually changed
-                        if content != utf8_content.encode('utf-8'):
-                            with open(filepath, 'w', encoding='utf-8', newline='') as f:
-                                f.write(utf8_content)
-                            self.logger.info(f"✨ Converted {filepath} from {encoding} to UTF-8")
-                        return utf8_content
                 except UnicodeDecodeError:
                     continue
-            
-            # If all encodings fail, try binary read with replacement
-            self.logger.warning(f"⚠️ All encodings failed for {filepath}, using replacement mode")
-            with open(filepath, 'rb') as f:
-                content = f.read()
-                decoded = content.decode('utf-8', errors='replace')
-                # Normalize line endings
+                    
+                # Not UTF-8, safe to convert
+                # Normalize line endings to system default without duplicating
                 lines = decoded.splitlines()
-                normalized = os.linesep.join(lines)
+                utf8_content = os.linesep.join(lines)
                 
-                # Only write back if absolutely necessary
-                try:
-                    original = content.decode('utf-8')
-                    if original == normalized:
-                        return original
-                except UnicodeDecodeError:
+                # Only write back if content actually changed
+                if content != utf8_content.encode('utf-8'):
                     with open(filepath, 'w', encoding='utf-8', newline='') as f:
-                        f.write(normalized)
-                    self.logger.warning(f"⚠️ Forced UTF-8 decode for {filepath}")
-                return normalized
+                        f.write(utf8_content)
+                    self.logger.info(f"✨ Converted {filepath} from {encoding} to UTF-8")
+                return utf8_content
+            
+            # If all encodings fail, decode with replacement
+            self.logger.warning(f"⚠️ All encodings failed for {filepath}, using replacement mode")
+            decoded = content.decode('utf-8', errors='replace')
+            # Normalize line endings
+            lines = decoded.splitlines()
+            normalized = os.linesep.join(lines)
+            
+            with open(filepath, 'w', encoding='utf-8', newline='') as f:
+                f.write(normalized)
+            self.logger.warning(f"⚠️ Forced UTF-8 decode for {filepath}")
+            return normalized
                 
         except Exception as e:
             self.logger.error(f"Failed to read {filepath}: {str(e)}")
             raise
 
+    def _cache_content(self, cache_path: str, signature: tuple, content: str):
+        """Store decoded content in the shared LRU cache."""
+        self._content_cache[cache_path] = (signature, content)
+        self._content_cache.move_to_end(cache_path)
+        while len(self._content_cache) > CONTENT_CACHE_SIZE:
+            self._content_cache.popitem(last=False)
+
     def convert_to_utf8(self, filepath: str) -> bool:
         """
         Convert a file to UTF-8 encoding.
@@ -102,6 +115,7 @@ class EncodingUtils:
         """
         try:
             # First try to detect current encoding
+            import chardet
             with open(filepath, 'rb') as f:
                 raw = f.read()
             detected = chardet.detect(raw)
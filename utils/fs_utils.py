@@ -1,8 +1,77 @@
 import os
+import re
 import fnmatch
-from typing import List, Set
+import threading
+from functools import lru_cache
+from typing import List
 from utils.logger import Logger
 
+# Tree drawing fragments used by build_tree_structure
+TREE_INDENT = "   "
+TREE_BRANCH = "├─ "
+TREE_LAST_BRANCH = "└─ "
+
+# Project files whose patterns extend the default ignore list
+IGNORE_FILES = ('.gitignore', '.aiderignore')
+
+# Patterns FSUtils always ignores, in addition to the ignore files
+DEFAULT_IGNORE_PATTERNS = (
+    '.git/*',
+    '.git*',
+    '.aider*',
+    'node_modules',
+    '__pycache__',
+    '*.pyc',
+    '*.pyo',
+    '*.pyd',
+    '.DS_Store',
+    'Thumbs.db'
+)
+
+# Parsed ignore files: absolute path -> ((st_mtime_ns, st_size), patterns)
+_ignore_file_cache = {}
+
+def read_ignore_file(filename: str) -> tuple:
+    """
+    Read the glob patterns of an ignore file such as .gitignore.
+    
+    Results are shared by every caller and only re-parsed when the file's
+    mtime or size changes.
+    
+    Args:
+        filename (str): Ignore file to read
+        
+    Returns:
+        tuple: Non-empty, non-comment lines; empty if the file doesn't exist
+        
+    Raises:
+        OSError, UnicodeDecodeError: If an existing file can't be read.
+            Failed reads are not cached, so they are retried on the next call.
+    """
+    path = os.path.abspath(filename)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return ()
+        
+    state = (stat.st_mtime_ns, stat.st_size)
+    cached = _ignore_file_cache.get(path)
+    if cached is not None and cached[0] == state:
+        return cached[1]
+        
+    with open(path, 'r', encoding='utf-8') as f:
+        patterns = tuple(line.strip() for line in f 
+                         if line.strip() and not line.startswith('#'))
+    _ignore_file_cache[path] = (state, patterns)
+    return patterns
+
+@lru_cache(maxsize=8)
+def _compile_ignore_patterns(patterns: tuple) -> re.Pattern:
+    """Combine glob ignore patterns into a single compiled regex."""
+    return re.compile('|'.join(
+        fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns
+    ))
+
 class FSUtils:
     """
     Utility class for file system operations and tree structure generation.
@@ -18,31 +87,37 @@ class FSUtils:
         self.logger = Logger()
         self.current_folder_path = None
         
-    def get_folder_files(self, folder_path: str) -> list:
-        """Get list of files in folder, respecting ignore patterns."""
-        ignore_patterns = self._get_ignore_patterns()
+    def get_folder_entries(self, folder_path: str) -> tuple:
+        """Get sorted (files, subfolders) of a folder in a single directory scan."""
+        ignore_regex = self._get_ignore_regex()
         files = []
+        folders = []
         
-        for entry in os.scandir(folder_path):
-            if entry.is_file():
-                rel_path = os.path.relpath(entry.path, '.')
-                if not self._should_ignore(rel_path, ignore_patterns):
-                    files.append(entry.name)
+        # Resolve the folder once; entry paths are then plain string joins
+        # instead of a relpath (two getcwd calls) per entry
+        rel_dir = os.path.relpath(folder_path, '.')
+        
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    target = files
+                elif entry.is_dir():
+                    target = folders
+                else:
+                    continue
+                rel_path = entry.name if rel_dir == '.' else os.path.join(rel_dir, entry.name)
+                if not self._should_ignore(rel_path, ignore_regex):
+                    target.append(entry.name)
                     
-        return sorted(files)
+        return sorted(files), sorted(folders)
+
+    def get_folder_files(self, folder_path: str) -> list:
+        """Get list of files in folder, respecting ignore patterns."""
+        return self.get_folder_entries(folder_path)[0]
 
     def get_subfolders(self, folder_path: str) -> list:
         """Get list of subfolders, respecting ignore patterns."""
-        ignore_patterns = self._get_ignore_patterns()
-        folders = []
-        
-        for entry in os.scandir(folder_path):
-            if entry.is_dir():
-                rel_path = os.path.relpath(entry.path, '.')
-                if not self._should_ignore(rel_path, ignore_patterns):
-                    folders.append(entry.name)
-                    
-        return sorted(folders)
+        return self.get_folder_entries(folder_path)[1]
 
     def build_tree_structure(self, current_path: str, files: list, subfolders: list, 
                            max_depth: int = 3, current_depth: int = 0, 
@@ -59,37 +134,50 @@ class FSUtils:
             max_depth = float('inf')  # Use infinity for unlimited depth
         
         # Determine if this is the active folder
-        is_active = os.path.abspath(current_path) == self.current_folder_path
+        abs_current_path = os.path.abspath(current_path)
+        is_active = abs_current_path == self.current_folder_path
+        
+        # Active folder with a trailing separator, for ancestor checks below
+        active_prefix = self.current_folder_path + os.sep if self.current_folder_path else None
         
         # Show root folder without indentation
         if current_depth == 0:
             active_indicator = "👉 " if is_active else ""
             tree.append(f"{active_indicator}📂 ./")
-            base_indent = "   "  # Base indentation for root level items
+            base_indent = TREE_INDENT  # Base indentation for root level items
         else:
             folder_name = os.path.basename(current_path)
-            base_indent = "   " * current_depth
+            base_indent = TREE_INDENT * current_depth
             active_indicator = "👉 " if is_active else ""
             tree.append(f"{base_indent}{active_indicator}📂 {folder_name}")
         
+        # Build the two possible line prefixes once per folder
+        branch_prefix = base_indent + TREE_BRANCH
+        last_prefix = base_indent + TREE_LAST_BRANCH
+        
         # Add files with proper indentation
+        last_file = len(files) - 1
         for i, f in enumerate(files):
-            prefix = "├─ " if (i < len(files) - 1 or subfolders) else "└─ "
-            tree.append(f"{base_indent}{prefix}{f}")
+            prefix = branch_prefix if (i < last_file or subfolders) else last_prefix
+            tree.append(prefix + f)
         
         # Add subfolders without extra indentation
+        last_folder = len(subfolders) - 1
         for i, d in enumerate(subfolders):
-            prefix = "├─ " if i < len(subfolders) - 1 else "└─ "
+            prefix = branch_prefix if i < last_folder else last_prefix
             subfolder_path = os.path.join(current_path, d)
             
-            # Determine if this subfolder is part of current path
-            is_current_subfolder = (is_current_branch and 
-                                  self.current_folder_path and 
-                                  subfolder_path in self.current_folder_path)
+            # Determine if this subfolder is part of current path, comparing
+            # whole path components so 'src' doesn't match 'src_old'
+            abs_subfolder_path = os.path.join(abs_current_path, d)
+            is_current_subfolder = bool(
+                is_current_branch and active_prefix and
+                (abs_subfolder_path == self.current_folder_path or
+                 active_prefix.startswith(abs_subfolder_path + os.sep))
+            )
             
             if is_current_subfolder or current_depth < max_depth:
-                sub_files = self.get_folder_files(subfolder_path)
-                sub_folders = self.get_subfolders(subfolder_path)
+                sub_files, sub_folders = self.get_folder_entries(subfolder_path)
                 
                 # Add subfolder and its contents
                 subtree = self.build_tree_structure(
@@ -103,47 +191,30 @@ class FSUtils:
                 tree.extend(subtree)
             else:
                 # Just show folder name for depth-limited branches
-                tree.append(f"{base_indent}{prefix}{d}/...")
+                tree.append(f"{prefix}{d}/...")
         
         return tree
 
     def _get_ignore_patterns(self) -> List[str]:
-        """Get list of patterns to ignore from .gitignore and defaults."""
-        patterns = [
-            '.git/*',
-            '.git*',
-            '.aider*',
-            'node_modules',
-            '__pycache__',
-            '*.pyc',
-            '*.pyo',
-            '*.pyd',
-            '.DS_Store',
-            'Thumbs.db'
-        ]
-        
-        # Add patterns from .gitignore if it exists
-        if os.path.exists('.gitignore'):
-            try:
-                with open('.gitignore', 'r', encoding='utf-8') as f:
-                    patterns.extend(line.strip() for line in f 
-                                  if line.strip() and not line.startswith('#'))
-            except Exception as e:
-                self.logger.warning(f"⚠️ Could not read .gitignore: {str(e)}")
-        
-        # Add patterns from .aiderignore if it exists        
-        if os.path.exists('.aiderignore'):
+        """Get list of patterns to ignore from .gitignore, .aiderignore and defaults.
+        
+        The ignore files are parsed through read_ignore_file, so they are only
+        re-read when they are created, removed or modified.
+        """
+        patterns = list(DEFAULT_IGNORE_PATTERNS)
+        for ignore_file in IGNORE_FILES:
             try:
-                with open('.aiderignore', 'r', encoding='utf-8') as f:
-                    patterns.extend(line.strip() for line in f 
-                                  if line.strip() and not line.startswith('#'))
-            except Exception as e:
-                self.logger.warning(f"⚠️ Could not read .aiderignore: {str(e)}")
-                
+                patterns.extend(read_ignore_file(ignore_file))
+            except (OSError, UnicodeDecodeError) as e:
+                self.logger.warning(f"⚠️ Could not read {ignore_file}: {str(e)}")
         return patterns
 
-    def _should_ignore(self, path: str, ignore_patterns: List[str]) -> bool:
-        """Check if a path should be ignored based on ignore patterns."""
+    def _get_ignore_regex(self) -> re.Pattern:
+        """Get the current ignore patterns compiled into a single regex."""
+        return _compile_ignore_patterns(tuple(self._get_ignore_patterns()))
+
+    def _should_ignore(self, path: str, ignore_regex: re.Pattern) -> bool:
+        """Check if a path should be ignored based on compiled ignore patterns."""
         # Normalize path for consistent comparison
         path = path.replace('\\', '/')
         
@@ -153,11 +224,58 @@ class FSUtils:
             return True
             
         # Check against other ignore patterns
-        for pattern in ignore_patterns:
-            if fnmatch.fnmatch(path, pattern):
-                return True
-        return False
+        return ignore_regex.match(os.path.normcase(path)) is not None
 
     def set_current_folder(self, folder_path: str):
         """Set the current folder path for tree building."""
         self.current_folder_path = os.path.abspath(folder_path)
+
+    @staticmethod
+    def extract_agent_name(filepath: str, prefix: str) -> str:
+        """
+        Extract the agent name from a KinOS file name.
+        
+        Strips the directory, the given prefix (e.g. '.aider.agent.') and a
+        trailing '.md' by slicing rather than chained str.replace calls.
+        
+        Args:
+            filepath (str): Path such as '.aider.agent.writing.md'
+            prefix (str): File name prefix to remove
+            
+        Returns:
+            str: Agent name, e.g. 'writing'
+        """
+        name = os.path.basename(filepath)
+        if name.startswith(prefix):
+            name = name[len(prefix):]
+        if name.endswith('.md'):
+            name = name[:-len('.md')]
+        return name
+
+    @staticmethod
+    def write_file_atomic(filepath: str, content: str, encoding: str = 'utf-8'):
+        """
+        Write content to a file atomically.
+        
+        Content is written to a temporary file in the same directory and then
+        swapped in with os.replace, so readers see either the previous
+        version or the complete new one, never a truncated file.
+        
+        Args:
+            filepath (str): Destination file path
+            content (str): Text content to write
+            encoding (str): Text encoding to use (default: utf-8)
+        """
+        # Unique per process and thread so concurrent writers never share it;
+        # a plain open() keeps the usual umask-based permissions
+        tmp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding=encoding) as f:
+                f.write(content)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
@@ -1,89 +1,108 @@
 import os
+import re
+import sys
+import locale
 import logging
 from colorama import init, Fore, Style
 import openai
 from dotenv import load_dotenv
+from utils.openai_client import get_openai_client
 
 # Add SUCCESS level between INFO and WARNING
 logging.SUCCESS = 25  # Between INFO(20) and WARNING(30)
 logging.addLevelName(logging.SUCCESS, 'SUCCESS')
 
+# Map of agent types to emojis
+_AGENT_EMOJIS = {
+    'specification': '📌',
+    'management': '🧭',
+    'writing': '🖋️',
+    'evaluation': '⚖️',
+    'deduplication': '👥',
+    'chronicler': '📜',
+    'redundancy': '🎭',
+    'production': '🏭',
+    'researcher': '🔬',
+    'integration': '🌐'
+}
+
+# Matches "agent <type>" / "Agent <type>" (also inside "l'agent <type>")
+_AGENT_NAME_PATTERN = re.compile(
+    r"([Aa]gent )(" + "|".join(map(re.escape, _AGENT_EMOJIS)) + r")"
+)
+
+# Shared formatter for suivi.md entries
+_FILE_FORMATTER = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s',
+                                    datefmt='%Y-%m-%d %H:%M:%S')
+
+class ColorFormatter(logging.Formatter):
+    """Console formatter that colors each record according to its level."""
+    
+    FORMATS = {
+        logging.DEBUG: Fore.CYAN + '%(asctime)s - %(levelname)s - %(message)s' + Style.RESET_ALL,
+        logging.INFO: Fore.GREEN + '%(asctime)s - %(levelname)s - %(message)s' + Style.RESET_ALL,
+        logging.SUCCESS: Fore.BLUE + Style.BRIGHT + '%(asctime)s - %(levelname)s - %(message)s' + Style.RESET_ALL,
+        logging.WARNING: Fore.YELLOW + '%(asctime)s - %(levelname)s - %(message)s' + Style.RESET_ALL,
+        logging.ERROR: Fore.RED + '%(asctime)s - %(levelname)s - %(message)s' + Style.RESET_ALL,
+        logging.CRITICAL: Fore.RED + Style.BRIGHT + '%(asctime)s - %(levelname)s - %(message)s' + Style.RESET_ALL
+    }
+    
+    def __init__(self):
+        super().__init__(datefmt='%Y-%m-%d %H:%M:%S')
+        # One formatter per level, built once instead of on every record
+        self._formatters = {
+            level: logging.Formatter(log_fmt, datefmt='%Y-%m-%d %H:%M:%S')
+            for level, log_fmt in self.FORMATS.items()
+        }
+        
+    def format(self, record):
+        formatter = self._formatters.get(record.levelno)
+        if formatter is None:
+            # Custom levels fall back to the plain format, as before
+            return super().format(record)
+        return formatter.format(record)
+
 class Logger:
     """Utility class for handling logging operations."""
     
     # Class variable for global log level
     _global_level = logging.SUCCESS
     
+    # Set once stdio, locale and colorama have been configured
+    _console_ready = False
+    
     def __init__(self, model="gpt-4o-mini"):
         """Initialize the logger with mission context."""
         self.model = model
-        # Force UTF-8 for stdin/stdout
-        import sys
-        sys.stdin.reconfigure(encoding='utf-8')
-        sys.stdout.reconfigure(encoding='utf-8')
+        self._setup_console()
 
-        # Load mission context
-        self.mission_content = self._load_mission_content()
-        
-        # Set locale to UTF-8
-        import locale
-        try:
-            locale.setlocale(locale.LC_ALL, 'fr_FR.UTF-8')
-        except locale.Error:
-            pass  # Continue if locale not available
-            
-        # Initialize colorama for cross-platform color support
-        init()
+        # Mission context is loaded on first use (see mission_content)
+        self._mission_content = None
         
-        # Add SUCCESS level between INFO and WARNING
-        logging.SUCCESS = 25  # Between INFO(20) and WARNING(30)
-        logging.addLevelName(logging.SUCCESS, 'SUCCESS')
-
         # Initialize OpenAI
         load_dotenv()
         openai.api_key = os.getenv('OPENAI_API_KEY')
         if not openai.api_key:
             raise ValueError("OpenAI API key not found in environment variables")
             
-        # Initialize suivi file path and handler
+        # Initialize suivi file path
         self.suivi_file = 'suivi.md'
-        file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s',
-                                         datefmt='%Y-%m-%d %H:%M:%S')
-
-        # Initialize file handler with UTF-8 encoding
-        file_handler = logging.FileHandler(self.suivi_file, encoding='utf-8', mode='a')
-        file_handler.setFormatter(file_formatter)
-        file_handler.setLevel(logging.SUCCESS)  # Only log SUCCESS and above
 
-        # Custom formatter with colors for console
-        class ColorFormatter(logging.Formatter):
-            FORMATS = {
-                logging.DEBUG: Fore.CYAN + '%(asctime)s - %(levelname)s - %(message)s' + Style.RESET_ALL,
-                logging.INFO: Fore.GREEN + '%(asctime)s - %(levelname)s - %(message)s' + Style.RESET_ALL,
-                logging.SUCCESS: Fore.BLUE + Style.BRIGHT + '%(asctime)s - %(levelname)s - %(message)s' + Style.RESET_ALL,
-                logging.WARNING: Fore.YELLOW + '%(asctime)s - %(levelname)s - %(message)s' + Style.RESET_ALL,
-                logging.ERROR: Fore.RED + '%(asctime)s - %(levelname)s - %(message)s' + Style.RESET_ALL,
-                logging.CRITICAL: Fore.RED + Style.BRIGHT + '%(asctime)s - %(levelname)s - %(message)s' + Style.RESET_ALL
-            }
-
-            def format(self, record):
-                log_fmt = self.FORMATS.get(record.levelno)
-                formatter = logging.Formatter(log_fmt, datefmt='%Y-%m-%d %H:%M:%S')
-                return formatter.format(record)
-
-        # Setup console handler with color formatter and SUCCESS level by default
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.SUCCESS)  # Set default handler level to SUCCESS
-        console_handler.setFormatter(ColorFormatter())
-        
         # Configure logger with global level
         self.logger = logging.getLogger('KinOS')
         self.logger.setLevel(self._global_level)
         
-        # Remove existing handlers and add our handlers
-        self.logger.handlers = []
-        self.logger.addHandler(console_handler)
-        self.logger.addHandler(file_handler)
+        # The KinOS logger is shared by every instance, so only attach the
+        # console and suivi.md handlers the first time instead of reopening
+        # the log file for each new Logger
+        if not self.logger.handlers:
+            # Setup console handler with color formatter and SUCCESS level by default
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(logging.SUCCESS)  # Set default handler level to SUCCESS
+            console_handler.setFormatter(ColorFormatter())
+            
+            self.logger.addHandler(console_handler)
+            self.logger.addHandler(self._create_file_handler())
         
         # Set handler levels to match global level
         for handler in self.logger.handlers:
@@ -92,6 +111,26 @@ class Logger:
         # Prevent propagation to root logger
         self.logger.propagate = False
 
+    @classmethod
+    def _setup_console(cls):
+        """Configure stdio encoding, locale and colorama once per process."""
+        if cls._console_ready:
+            return
+            
+        # Force UTF-8 for stdin/stdout
+        sys.stdin.reconfigure(encoding='utf-8')
+        sys.stdout.reconfigure(encoding='utf-8')
+        
+        # Set locale to UTF-8
+        try:
+            locale.setlocale(locale.LC_ALL, 'fr_FR.UTF-8')
+        except locale.Error:
+            pass  # Continue if locale not available
+            
+        # Initialize colorama for cross-platform color support
+        init()
+        cls._console_ready = True
+
     @classmethod
     def set_global_level(cls, level):
         """Set the global logging level for all logger instances."""
@@ -103,63 +142,52 @@ class Logger:
                 for handler in logger.handlers:
                     handler.setLevel(level)
         
+    def _create_file_handler(self):
+        """Create the UTF-8 suivi.md handler that records SUCCESS and above."""
+        file_handler = logging.FileHandler(self.suivi_file, encoding='utf-8', mode='a')
+        file_handler.setFormatter(_FILE_FORMATTER)
+        file_handler.setLevel(logging.SUCCESS)  # Only log SUCCESS and above
+        return file_handler
+        
     def _get_agent_emoji(self, text):
         """Parse text for agent names and add their emoji prefixes."""
-        # Map of agent types to emojis
-        agent_emojis = {
-            'specification': '📌',
-            'management': '🧭', 
-            'writing': '🖋️',
-            'evaluation': '⚖️',
-            'deduplication': '👥',
-            'chronicler': '📜',
-            'redundancy': '🎭',
-            'production': '🏭',
-            'researcher': '🔬',
-            'integration': '🌐'
-        }
-        
-        # Replace agent names with emoji prefixed versions
-        modified_text = text
-        for agent_type, emoji in agent_emojis.items():
-            # Look for agent name with various prefixes/formats
-            patterns = [
-                f"agent {agent_type}",
-                f"Agent {agent_type}",
-                f"l'agent {agent_type}",
-                f"L'agent {agent_type}"
-            ]
-            
-            for pattern in patterns:
-                modified_text = modified_text.replace(
-                    pattern, 
-                    f"{pattern[:pattern.index(agent_type)]}{emoji} {agent_type}"
-                )
-                
-        return modified_text
+        return _AGENT_NAME_PATTERN.sub(
+            lambda match: f"{match.group(1)}{_AGENT_EMOJIS[match.group(2)]} {match.group(2)}",
+            text
+        )
 
     def info(self, message):
         """Log info level message in green with agent emoji if present."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self.logger.info(self._get_agent_emoji(message))
         
     def error(self, message):
         """Log error level message in red with agent emoji if present."""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
         formatted_msg = self._get_agent_emoji(message)
         self.logger.error(formatted_msg)
         
     def debug(self, message):
         """Log debug level message in cyan with agent emoji if present."""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         formatted_msg = self._get_agent_emoji(message)
         self.logger.debug(formatted_msg)
         
     def success(self, message):
         """Log success level message in bright blue with agent emoji if present."""
+        if not self.logger.isEnabledFor(logging.SUCCESS):
+            return
         formatted_msg = self._get_agent_emoji(message)
         self.logger.log(logging.SUCCESS, formatted_msg)
         self._check_and_summarize_logs()  # Check size after adding new log
         
     def warning(self, message):
         """Log warning level message in yellow with agent emoji if present."""
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
         formatted_msg = self._get_agent_emoji(message)
         self.logger.warning(formatted_msg)
         
@@ -190,6 +218,13 @@ class Logger:
                     f.write(content)
                 self.logger.success(f"✅ Converted {filepath} from {encoding} to UTF-8")
         
+    @property
+    def mission_content(self):
+        """Mission text, read from .aider.mission.md the first time it is needed."""
+        if self._mission_content is None:
+            self._mission_content = self._load_mission_content()
+        return self._mission_content
+        
     def _load_mission_content(self):
         """Load mission content from .aider.mission.md file."""
         try:
@@ -197,8 +232,8 @@ class Logger:
                 with open('.aider.mission.md', 'r', encoding='utf-8') as f:
                     return f.read()
             return ""
-        except Exception as e:
-            print(f"Warning: Could not load mission file: {str(e)}")
+        except (OSError, UnicodeDecodeError) as e:
+            self.logger.warning("⚠️ Could not load mission file: %s", e)
             return ""
 
     def _check_and_summarize_logs(self):
@@ -207,6 +242,11 @@ class Logger:
             if not os.path.exists(self.suivi_file):
                 return
 
+            # A file under the threshold in bytes can't exceed it in characters,
+            # so skip the handler swap and full read on the common path
+            if os.path.getsize(self.suivi_file) <= 25000:
+                return
+
             # First close the current handler
             for handler in self.logger.handlers[:]:
                 if isinstance(handler, logging.FileHandler) and handler.baseFilename == os.path.abspath(self.suivi_file):
@@ -263,7 +303,7 @@ class Logger:
                 # Continue with GPT summarization...
                 self.logger.log(logging.SUCCESS, "📝 Generating mission tracking...")
                 
-                client = openai.OpenAI()
+                client = get_openai_client()
                 response = client.chat.completions.create(
                     model="gpt-4o-mini",
                     messages=[
@@ -314,19 +354,9 @@ Create a detailed progress summary that shows how recent activities align with m
                 self.logger.log(logging.SUCCESS, "✨ Mission tracking summarized successfully")
             
             # Re-add the file handler
-            file_handler = logging.FileHandler(self.suivi_file, encoding='utf-8', mode='a')
-            file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s',
-                                             datefmt='%Y-%m-%d %H:%M:%S')
-            file_handler.setFormatter(file_formatter)
-            file_handler.setLevel(logging.SUCCESS)
-            self.logger.addHandler(file_handler)
+            self.logger.addHandler(self._create_file_handler())
                 
         except Exception as e:
             self.logger.error(f"⚠️ Error summarizing mission tracking: {str(e)}")
             # Make sure we restore the file handler even if there's an error
-            file_handler = logging.FileHandler(self.suivi_file, encoding='utf-8', mode='a')
-            file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s',
-                                             datefmt='%Y-%m-%d %H:%M:%S')
-            file_handler.setFormatter(file_formatter)
-            file_handler.setLevel(logging.SUCCESS)
-            self.logger.addHandler(file_handler)
+            self.logger.addHandler(self._create_file_handler())
@@ -0,0 +1,27 @@
+import threading
+import openai
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_openai_client():
+    """
+    Get the process-wide OpenAI client, creating it on first use.
+
+    The client keeps its HTTP connection pool between calls, so sharing a
+    single instance lets every manager reuse open connections instead of
+    building a new client for each request.
+
+    Returns:
+        openai.OpenAI: Shared client instance
+
+    Note:
+        Uses double-checked locking so concurrent first calls from executor
+        threads still create only one client
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = openai.OpenAI()
+    return _client